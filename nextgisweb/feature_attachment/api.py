@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
-from StringIO import StringIO
+from io import BytesIO
 import json
 
 from PIL import Image
@@ -40,7 +40,7 @@ def image(resource, request):
             map(int, request.GET['size'].split('x')),
             Image.ANTIALIAS)
 
-    buf = StringIO()
+    buf = BytesIO()
     image.save(buf, image.format)
     buf.seek(0)
 
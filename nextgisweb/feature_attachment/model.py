@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
 from collections import OrderedDict
-from shutil import copyfileobj
+from shutil import copyfile, SpecialFileError
 
 from .. import db
 from ..env import env
@@ -11,6 +11,28 @@ from ..file_storage import FileObj
 
 Base = declarative_base()
 
+COPY_BUFSIZE = 256 * 1024
+
+
+def _copy_file(srcfile, dstfile):
+    try:
+        copyfile(srcfile, dstfile)
+        return
+    except SpecialFileError:
+        # Source or destination isn't a regular file (for example a named
+        # pipe), fallback to copying through a reusable buffer.
+        pass
+
+    buf = bytearray(COPY_BUFSIZE)
+    mv = memoryview(buf)
+    with open(srcfile, 'rb') as fs, open(dstfile, 'wb') as fd:
+        read, write = fs.readinto, fd.write
+        while True:
+            n = read(buf)
+            if not n:
+                break
+            write(mv[:n])
+
 
 class FeatureAttachment(Base):
     __tablename__ = 'feature_attachment'
@@ -51,8 +73,7 @@ class FeatureAttachment(Base):
             srcfile, _ = env.file_upload.get_filename(file_upload['id'])
             dstfile = env.file_storage.filename(self.fileobj, makedirs=True)
 
-            with open(srcfile, 'r') as fs, open(dstfile, 'w') as fd:
-                copyfileobj(fs, fd)
+            _copy_file(srcfile, dstfile)
 
             for k in ('name', 'mime_type', 'size'):
                 if k in file_upload:
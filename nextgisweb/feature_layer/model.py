@@ -1,11 +1,12 @@
 # -*- coding: utf-8 -*-
 from collections import OrderedDict
+from operator import attrgetter
 
 from sqlalchemy.ext.declarative import declared_attr
 from sqlalchemy.ext.orderinglist import ordering_list
 
 from .. import db
-from ..models import declarative_base
+from ..models import declarative_base, DBSession
 from ..resource import (
     Resource,
     DataStructureScope,
@@ -18,6 +19,13 @@ from .util import _
 
 Base = declarative_base()
 
+_TO_DICT_KEYS = (
+    'id', 'layer_id', 'cls',
+    'idx', 'keyname', 'datatype',
+    'display_name', 'grid_visibility',
+)
+_TO_DICT_GET = attrgetter(*_TO_DICT_KEYS)
+
 
 class LayerField(Base):
     __tablename__ = 'layer_field'
@@ -48,14 +56,7 @@ class LayerField(Base):
         return self.display_name
 
     def to_dict(self):
-        return dict(
-            (c, getattr(self, c))
-            for c in (
-                'id', 'layer_id', 'cls',
-                'idx', 'keyname', 'datatype',
-                'display_name', 'grid_visibility',
-            )
-        )
+        return dict(zip(_TO_DICT_KEYS, _TO_DICT_GET(self)))
 
 
 class LayerFieldsMixin(object):
@@ -85,9 +86,8 @@ class LayerFieldsMixin(object):
         return db.relationship(
             cls.__field_class__,
             uselist=False,
-            primaryjoin="%s.id == %s.feature_label_field_id" % (
-                cls.__field_class__.__name__, cls.__name__
-            ),
+            primaryjoin=lambda: (
+                cls.__field_class__.id == cls.feature_label_field_id),
             cascade='all',
             post_update=True
         )
@@ -96,50 +96,53 @@ class LayerFieldsMixin(object):
 class _fields_attr(SP):
 
     def getter(self, srlzr):
-        return map(
-            lambda f: OrderedDict((
-                ('id', f.id), ('keyname', f.keyname),
-                ('datatype', f.datatype), ('typemod', None),
-                ('display_name', f.display_name),
-                ('label_field', f == srlzr.obj.feature_label_field),
-                ('grid_visibility', f.grid_visibility))),
-            srlzr.obj.fields)
+        label_id = srlzr.obj.feature_label_field_id
+        return [OrderedDict((
+            ('id', f.id), ('keyname', f.keyname),
+            ('datatype', f.datatype), ('typemod', None),
+            ('display_name', f.display_name),
+            ('label_field', label_id is not None and f.id == label_id),
+            ('grid_visibility', f.grid_visibility),
+        )) for f in srlzr.obj.fields]
 
     def setter(self, srlzr, value):
         obj = srlzr.obj
 
-        fldmap = dict()
-        for idx, fld in reversed(list(enumerate(list(obj.fields)))):
-            if fld.id:
-                fldmap[fld.id] = fld
-                obj.fields.pop(idx)
-
-        obj.feature_label_field = None
-
-        for fld in value:
-            fldid = fld.get('id')
-
-            if fldid:
-                mfld = fldmap.get(fldid)
-                if mfld is None:
-                    raise ValidationError(_("Field not found (ID=%d)." % fldid))
-            else:
-                mfld = obj.__field_class__(
-                    datatype=fld['datatype'])
-
-            if 'keyname' in fld:
-                mfld.keyname = fld['keyname']
-            if 'display_name' in fld:
-                mfld.display_name = fld['display_name']
-            if 'grid_visibility' in fld:
-                mfld.grid_visibility = fld['grid_visibility']
-
-            if fld.get('label_field', False):
-                obj.feature_label_field = mfld
-
-            obj.fields.append(mfld)
-
-        obj.fields.reorder()
+        with DBSession.no_autoflush:
+            fldmap = {f.id: f for f in obj.fields if f.id}
+
+            obj.feature_label_field = None
+
+            fields = []
+            for fld in value:
+                fldid = fld.get('id')
+
+                if fldid:
+                    mfld = fldmap.get(fldid)
+                    if mfld is None:
+                        raise ValidationError(
+                            _("Field not found (ID=%d)." % fldid))
+                else:
+                    mfld = obj.__field_class__(
+                        datatype=fld['datatype'])
+
+                if 'keyname' in fld:
+                    mfld.keyname = fld['keyname']
+                if 'display_name' in fld:
+                    mfld.display_name = fld['display_name']
+                if 'grid_visibility' in fld:
+                    mfld.grid_visibility = fld['grid_visibility']
+
+                if fld.get('label_field', False):
+                    obj.feature_label_field = mfld
+
+                fields.append(mfld)
+
+            # Replace the whole collection at once, SQLAlchemy diffs old and
+            # new members itself: only dropped fields become orphans and get
+            # deleted, kept ones are updated in place and new ones inserted.
+            obj.fields = fields
+            obj.fields.reorder()
 
 
 P_DSS_READ = DataStructureScope.read
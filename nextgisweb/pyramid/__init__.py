@@ -1,10 +1,8 @@
 # -*- coding: utf-8 -*-
-import sys
 import os.path
-import re
+import logging
 from hashlib import md5
-from StringIO import StringIO
-from pkg_resources import resource_filename, get_distribution
+from pkg_resources import resource_filename, working_set
 from collections import namedtuple
 
 from pyramid.config import Configurator
@@ -23,9 +21,12 @@ from .util import (
     RequestMethodPredicate,
     JsonPredicate)
 from .auth import AuthenticationPolicy
+from .vcs import editable_projects, is_editable, git_commit
 
 __all__ = ['viewargs', ]
 
+logger = logging.getLogger(__name__)
+
 
 class RouteHelper(object):
 
@@ -77,12 +78,68 @@ class ExtendedConfigurator(Configurator):
 
 DistInfo = namedtuple('DistInfo', ['name', 'version', 'commit'])
 
+# Same packages pip freeze doesn't list: stdlib pseudo-distributions
+# and packaging tools.
+_DIST_SKIP = ('python', 'wsgiref', 'argparse',
+              'pip', 'setuptools', 'distribute', 'wheel')
+
+
+def _compute_static_key():
+    """ To not clear static cache by hand make it so that URLs are
+    different. Use md5 hash from names and versions of all installed
+    packages. For packages installed in develop mode from git working
+    tree (pip install -e) current commit is used too, this also helps.
+    Installed packages can't change within a running process, so it's
+    computed only once at module import. """
+
+    h = md5()
+    distinfo = []
+
+    editable = editable_projects()
+
+    for dist in sorted(working_set, key=lambda d: d.project_name.lower()):
+        if dist.key in _DIST_SKIP:
+            continue
+
+        commit = None
+        if is_editable(dist, editable):
+            try:
+                commit = git_commit(dist.location)
+            except EnvironmentError:
+                logger.warning(
+                    "Failed to read git commit of %s at %s",
+                    dist.project_name, dist.location, exc_info=True)
+
+        h.update(('%s==%s@%s\n' % (
+            dist.project_name, dist.version, commit or '')).encode('utf-8'))
+        distinfo.append(DistInfo(
+            name=dist.project_name.lower(),
+            version=dist.version,
+            commit=commit[:8] if commit else None))
+
+    return '/' + h.hexdigest(), distinfo
+
+
+try:
+    _STATIC_KEY, _DISTINFO = _compute_static_key()
+except Exception:
+    logger.exception(
+        "Failed to compute static key from installed packages, "
+        "static cache busting and package info are disabled")
+    _STATIC_KEY, _DISTINFO = '', []
+
 
 class PyramidComponent(Component):
     identity = 'pyramid'
 
     def make_app(self, settings=None):
-        settings = dict(self._settings, **settings)
+        # Configurator copies settings into its own Settings dict anyway,
+        # so a single shallow copy is enough to keep component settings
+        # untouched by the modifications below.
+        if settings is None:
+            settings = dict(self._settings)
+        else:
+            settings = dict(self._settings, **settings)
 
         settings['mako.directories'] = 'nextgisweb:templates/'
 
@@ -151,62 +208,8 @@ class PyramidComponent(Component):
                 hploc = key.split('.')[-1]
                 self.help_page[hploc] = settings[key]
 
-        # To not clear static cache by hand make it so that
-        # URLs are different. Use md5 hash from all installed packages
-        # which we can get with pip freeze. pip freeze
-        # also returns current commit for packages from
-        # VCS, this also helps.
-
-        # This could've been done better, but right now simply
-        # redirect sys.stdout to StringIO, run pip freeze and
-        # return sys.stdout to initial state.
-
-        try:
-            from pip._internal import main as pip_main
-        except ImportError:
-            from pip import main as pip_main
-
-        stdout = sys.stdout
-        static_key = ''
-
-        try:
-            buf = StringIO()
-            sys.stdout = buf
-            pip_main(['freeze', ])
-            h = md5()
-            h.update(buf.getvalue())
-            static_key = '/' + h.hexdigest()
-        finally:
-            sys.stdout = stdout
-
-        self.distinfo = []
-
-        # Read installed packages from pip freeze
-
-        buf.seek(0)
-
-        for l in buf:
-            l = l.strip().lower()
-
-            dinfo = None
-            mpkg = re.match(r'(.+)==(.+)', l)
-            if mpkg:
-                dinfo = DistInfo(
-                    name=mpkg.group(1),
-                    version=mpkg.group(2),
-                    commit=None)
-
-            mgit = re.match(r'-e\sgit\+.+\@(.{8}).{32}\#egg=(\w+).*$', l)
-            if mgit:
-                dinfo = DistInfo(
-                    name=mgit.group(2),
-                    version=get_distribution(mgit.group(2)).version,
-                    commit=mgit.group(1))
-
-            if dinfo is not None:
-                self.distinfo.append(dinfo)
-            else:
-                self.logger.warn("Could not parse pip freeze line: %s", l)
+        static_key = _STATIC_KEY
+        self.distinfo = _DISTINFO
 
         config.add_static_view(
             '/static%s/asset' % static_key,
@@ -218,9 +221,13 @@ class PyramidComponent(Component):
         for comp in self._env.chain('setup_pyramid'):
             comp.setup_pyramid(config)
 
+        # Components and their dependencies don't change after
+        # initialization, so resolve the chain once, not per request.
+        amd_base_chain = self._env.chain('amd_base')
+
         def amd_base(request):
             amds = []
-            for comp in self._env.chain('amd_base'):
+            for comp in amd_base_chain:
                 amds.extend(comp.amd_base)
             return amds
 
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+""" Information about packages installed in develop mode (pip install -e)
+from VCS working trees. Git isn't invoked, files under .git are read
+directly. """
+from __future__ import unicode_literals
+import os
+import os.path
+import sys
+
+from pkg_resources import safe_name, to_filename
+
+
+def _project_key(name):
+    return to_filename(safe_name(name)).lower()
+
+
+def editable_projects():
+    """ Return set of normalized project names installed in develop mode,
+    i.e. having an .egg-link file in one of sys.path directories. """
+
+    result = set()
+    for path in sys.path:
+        try:
+            names = os.listdir(path)
+        except EnvironmentError:
+            # Not a directory (zip file) or not readable
+            continue
+        for fn in names:
+            if fn.endswith('.egg-link'):
+                result.add(_project_key(fn[:-len('.egg-link')]))
+    return result
+
+
+def is_editable(dist, projects):
+    return _project_key(dist.project_name) in projects
+
+
+def _read(fn):
+    with open(fn, 'r') as fd:
+        return fd.read().strip()
+
+
+def git_commit(path):
+    """ Return commit of git working tree at ``path`` or None if ``path``
+    isn't a git working tree. """
+
+    gitdir = os.path.join(path, '.git')
+    if os.path.isfile(gitdir):
+        # Worktree or submodule: .git file points to git directory
+        line = _read(gitdir)
+        if not line.startswith('gitdir:'):
+            return None
+        gitdir = os.path.join(path, line[len('gitdir:'):].strip())
+
+    head = os.path.join(gitdir, 'HEAD')
+    if not os.path.isfile(head):
+        return None
+
+    ref = _read(head)
+    if not ref.startswith('ref:'):
+        # Detached HEAD contains commit itself
+        return ref or None
+    ref = ref[len('ref:'):].strip()
+
+    # Refs of a worktree are shared with the main git directory
+    commondir = os.path.join(gitdir, 'commondir')
+    if os.path.isfile(commondir):
+        gitdir = os.path.join(gitdir, _read(commondir))
+
+    reffile = os.path.join(gitdir, ref)
+    if os.path.isfile(reffile):
+        return _read(reffile) or None
+
+    packed = os.path.join(gitdir, 'packed-refs')
+    if os.path.isfile(packed):
+        with open(packed, 'r') as fd:
+            for line in fd:
+                parts = line.strip().split(' ')
+                if len(parts) == 2 and parts[1] == ref:
+                    return parts[0]
+
+    return None
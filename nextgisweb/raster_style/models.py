@@ -6,7 +6,7 @@ import PIL
 from osgeo import gdal_array
 from pkg_resources import resource_filename
 from zope.interface import implements
-from StringIO import StringIO
+from io import BytesIO
 
 from ..models import declarative_base
 from ..resource import Resource, DataScope
@@ -129,7 +129,7 @@ class RasterStyle(Base, Resource):
         raster_icon = resource_filename('nextgisweb',
                                         'raster_style/iconRaster.png')
         img = PIL.Image.open(raster_icon)
-        buf = StringIO()
+        buf = BytesIO()
         img.save(buf, 'png')
         buf.seek(0)
 
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals, print_function, absolute_import
-from StringIO import StringIO
+from io import BytesIO
 
 from PIL import Image
 from pyramid.response import Response
@@ -47,7 +47,7 @@ def tile(request):
     if aimg is None:
         aimg = Image.new('RGBA', (256, 256))
 
-    buf = StringIO()
+    buf = BytesIO()
     aimg.save(buf, 'png')
     buf.seek(0)
 
@@ -87,7 +87,7 @@ def image(request):
     if aimg is None:
         aimg = Image.new('RGBA', p_size)
 
-    buf = StringIO()
+    buf = BytesIO()
     aimg.save(buf, 'png')
     buf.seek(0)
 
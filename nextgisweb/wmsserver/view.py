@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
-from StringIO import StringIO
+from io import BytesIO
 
 from lxml import etree
 from lxml.builder import ElementMaker
@@ -150,7 +150,7 @@ def _get_map(obj, request):
         limg = req.render_extent(p_bbox, p_size)
         img.paste(limg, (0, 0), limg)
 
-    buf = StringIO()
+    buf = BytesIO()
 
     if p_format == 'image/jpeg':
         img.save(buf, 'jpeg')